@@ -14,14 +14,23 @@ Run with --help for detailed options and examples.
 More information: https://github.com/empovit/support-tools/tree/main/extract_flatten
 """
 
+import os
 import sys
+import posixpath
 import shutil
 import argparse
 import tempfile
 import zipfile
 import tarfile
 import gzip
-import hashlib
+import zlib
+import io
+import threading
+import subprocess
+from contextlib import ExitStack, contextmanager
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import partial
 from pathlib import Path
 
 # Try to import optional libraries for additional archive support
@@ -37,6 +46,54 @@ try:
 except ImportError:
     HAS_RAR = False
 
+# ISA-L's igzip is a drop-in, considerably faster replacement for gzip
+try:
+    from isal import igzip as gzip_mod
+except ImportError:
+    gzip_mod = gzip
+
+# External decompressors, run in their own process (multi-threaded where the tool supports it)
+# so decompression does not hold the GIL
+GZIP_CMD = shutil.which('pigz') or shutil.which('igzip')
+BZIP2_CMD = shutil.which('pbzip2') or shutil.which('lbzip2')
+XZ_CMD = shutil.which('xz')
+
+# Buffer size for streaming copies out of archives and decompressors
+COPY_BUFSIZE = 1024 * 1024
+
+# Files up to this size are copied with one read and one write
+SMALL_FILE_SIZE = 64 * 1024
+
+
+class _ChainedFiles(io.RawIOBase):
+    """Read-only stream over several files, read back to back."""
+
+    def __init__(self, paths):
+        self._paths = iter(paths)
+        self._current = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while True:
+            if self._current is None:
+                path = next(self._paths, None)
+                if path is None:
+                    return 0
+                self._current = open(path, 'rb', buffering=0)
+            count = self._current.readinto(b)
+            if count:
+                return count
+            self._current.close()
+            self._current = None
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        super().close()
+
 
 class ArchiveExtractor:
     """Handles extraction and flattening of archives and directories."""
@@ -44,50 +101,155 @@ class ArchiveExtractor:
     # Extensions that should get .txt appended
     TXT_EXTENSIONS = {'.yaml', '.yml', '.list', '.log', '.descr', '.status', '.labels'}
 
-    def __init__(self, source_path, output_dir):
+    # OS metadata files that are skipped wherever they appear
+    METADATA_FILES = frozenset({
+        '.DS_Store', '.Trashes', '.fseventsd', '.Spotlight-V100', '.TemporaryItems',  # macOS
+        'Thumbs.db', 'desktop.ini', '$RECYCLE.BIN',  # Windows
+        '.directory',  # Linux (KDE folder settings)
+    })
+
+    # OS metadata directories whose whole contents are skipped
+    METADATA_DIRS = frozenset({'__MACOSX', '.Trashes', '.fseventsd', '.Spotlight-V100', '.TemporaryItems', '$RECYCLE.BIN'})
+
+    # Files larger than this (in bytes) are split into parts on line boundaries
+    MAX_CHUNK_SIZE = 2.9 * 1000 * 1000
+
+    # Supported archive suffixes; compound suffixes come first so they win over e.g. .gz
+    ARCHIVE_SUFFIXES = ('.tar.gz', '.tar.bz2', '.tar.xz', '.zip', '.tar', '.tgz', '.tbz2', '.txz', '.gz', '.7z', '.rar')
+
+    # Archive formats that can be read member by member without a temporary directory
+    STREAMABLE_SUFFIXES = {'.zip', '.tar', '.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.tbz2', '.txz'}
+
+    def __init__(self, source_path, output_dir, verbose=False, workers=None):
         self.source_path = Path(source_path)
         self.output_dir = Path(output_dir)
+        self._output_dir_str = str(self.output_dir)  # Joined with plain strings in the per-file path
+        self.verbose = verbose  # Print a line for every file, not just progress
+
+        # Copying is I/O bound, so use more threads than cores by default
+        self.workers = workers if workers is not None else min(32, (os.cpu_count() or 1) * 4)
 
         # Check if output directory exists and is not empty
         if self.output_dir.exists():
-            # Check if directory is not empty
-            try:
-                next(self.output_dir.iterdir())
-                # If we get here, directory is not empty
+            # Check if directory is not empty; the scandir handle is closed either way
+            with os.scandir(self.output_dir) as it:
+                first_entry = next(it, None)
+            if first_entry is not None:
                 raise ValueError(f"Output directory is not empty: {self.output_dir}\n"
                                f"Please use an empty directory or remove existing files.")
-            except StopIteration:
-                # Directory is empty, we can proceed
-                pass
         else:
             # Create the directory
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.hash_to_path = {}  # Track hash to source path mapping
+        self._prefix_cache = {}  # Source path -> "HASH_" filename prefix
+        self._reports = deque()  # Messages from copy workers, printed by the main thread
+        self._local = threading.local()  # Per-thread copy buffer, see _copy_stream()
+        self._zip_lock = threading.Lock()  # See _open_zip_member()
+        self._pending_outputs = {}  # (relative_dir, file_name) -> future last submitted to write it
+        self._output_chunks = {}  # (relative_dir, file_name) -> number of chunks written for it, 0 if whole
+
+        # Archive suffix -> extraction method, built once instead of an if/elif chain per archive
+        self._extractors = {
+            '.zip': self._extract_zip,
+            '.tar': self._extract_tar,
+            '.tar.gz': self._extract_tar,
+            '.tar.bz2': self._extract_tar,
+            '.tar.xz': self._extract_tar,
+            '.tgz': self._extract_tar,
+            '.tbz2': self._extract_tar,
+            '.txz': self._extract_tar,
+            '.7z': self._extract_7z,
+            '.rar': self._extract_rar,
+            '.gz': self._extract_gz,
+        }
 
     def is_archive(self, path):
         """Check if the given path is a supported archive format."""
-        path = Path(path)
-        suffix_lower = path.suffix.lower()
-
-        # Check for compound extensions like .tar.gz
-        if len(path.suffixes) >= 2:
-            compound = ''.join(path.suffixes[-2:]).lower()
-            if compound in {'.tar.gz', '.tar.bz2', '.tar.xz'}:
-                return True
-
-        # Check single extensions
-        archive_extensions = {'.zip', '.tar', '.tgz', '.tbz2', '.txz', '.gz', '.7z', '.rar'}
-        return suffix_lower in archive_extensions
+        return str(path).lower().endswith(self.ARCHIVE_SUFFIXES)
 
     def _extract_zip(self, archive_path, temp_dir):
         """Extract ZIP archive."""
         with zipfile.ZipFile(archive_path, 'r') as zf:
             zf.extractall(temp_dir)
 
+    def _is_gzip(self, path):
+        """Check the gzip magic number; the suffix alone can be misleading."""
+        with open(path, 'rb') as f:
+            return f.read(2) == b'\x1f\x8b'
+
+    def _is_gzipped_tar(self, archive_path):
+        """Check if a gzip file holds a TAR archive, by the ustar magic in the first header block."""
+        if not self._is_gzip(archive_path):
+            return False
+        try:
+            # Decompress in-process: only the first block is needed
+            with gzip_mod.open(archive_path, 'rb') as gz_file:
+                header = gz_file.read(tarfile.BLOCKSIZE)
+        except (OSError, EOFError):
+            return False
+        return header[257:262] == b'ustar'
+
+    def _find_parallel_decompressor(self, path):
+        """Return the command line of an installed external decompressor for a compressed file, or None."""
+        with open(path, 'rb') as f:
+            magic = f.read(6)
+        if magic.startswith(b'\x1f\x8b') and GZIP_CMD:
+            return [GZIP_CMD, '-dc']
+        if magic.startswith(b'BZh') and BZIP2_CMD:
+            return [BZIP2_CMD, '-dc']
+        if magic == b'\xfd7zXZ\x00' and XZ_CMD:
+            # -T0 decompresses multi-block files on all cores (xz 5.4+)
+            return [XZ_CMD, '-dc', '-T0']
+        return None
+
+    @contextmanager
+    def _decompress_pipe(self, command, archive_path):
+        """Yield a stream of the decompressed contents of a file, produced by an external command."""
+        with subprocess.Popen(command + [str(archive_path)],
+                              stdout=subprocess.PIPE, bufsize=COPY_BUFSIZE) as proc:
+            yield proc.stdout
+            # Drain any trailing padding the reader did not need, so the decompressor can exit
+            while proc.stdout.read(COPY_BUFSIZE):
+                pass
+        if proc.returncode != 0:
+            raise ValueError(f"{os.path.basename(command[0])} failed to decompress {archive_path} "
+                             f"(exit code {proc.returncode})")
+
+    @contextmanager
+    def _open_gzip(self, archive_path):
+        """Yield a stream of the decompressed contents of a gzip file."""
+        if GZIP_CMD:
+            with self._decompress_pipe([GZIP_CMD, '-dc'], archive_path) as stream:
+                yield stream
+        else:
+            # Feed zlib from a large read buffer
+            with open(archive_path, 'rb', buffering=COPY_BUFSIZE) as raw_file:
+                with gzip_mod.GzipFile(fileobj=raw_file, mode='rb') as gz_file:
+                    yield gz_file
+
+    @contextmanager
+    def _open_tar_stream(self, archive_path):
+        """Open a TAR archive (including compressed variants) for a single streaming pass."""
+        # Decompress outside tarfile where possible: its stream reader keeps and slices an extra
+        # compressed buffer, and cannot use isal or an external decompressor
+        command = self._find_parallel_decompressor(archive_path)
+        if command:
+            with self._decompress_pipe(command, archive_path) as stream:
+                with tarfile.open(fileobj=stream, mode='r|', bufsize=COPY_BUFSIZE) as tf:
+                    yield tf
+        elif self._is_gzip(archive_path):
+            with self._open_gzip(archive_path) as stream:
+                with tarfile.open(fileobj=stream, mode='r|', bufsize=COPY_BUFSIZE) as tf:
+                    yield tf
+        else:
+            # Large reads, no seeking back into the compressed data
+            with tarfile.open(archive_path, 'r|*', bufsize=COPY_BUFSIZE) as tf:
+                yield tf
+
     def _extract_tar(self, archive_path, temp_dir):
         """Extract TAR archive (including compressed variants)."""
-        with tarfile.open(archive_path, 'r:*') as tf:
+        with self._open_tar_stream(archive_path) as tf:
             tf.extractall(temp_dir)
 
     def _extract_7z(self, archive_path, temp_dir):
@@ -112,9 +274,9 @@ class ArchiveExtractor:
         decompressed_name = archive_path.stem  # Remove .gz extension
         decompressed_path = Path(temp_dir) / decompressed_name
 
-        with gzip.open(str(archive_path), 'rb') as gz_file:
+        with self._open_gzip(archive_path) as gz_file:
             with open(decompressed_path, 'wb') as out_file:
-                shutil.copyfileobj(gz_file, out_file)
+                self._copy_stream(gz_file, out_file)
 
         # Check if the decompressed file is another archive
         if self.is_archive(decompressed_path):
@@ -125,64 +287,192 @@ class ArchiveExtractor:
             # Remove the intermediate decompressed file
             decompressed_path.unlink()
 
+    def _get_archive_suffix(self, archive_path):
+        """Return the lowercased archive suffix, including compound ones like .tar.gz."""
+        name = str(archive_path).lower()
+        for suffix in self.ARCHIVE_SUFFIXES:
+            if name.endswith(suffix):
+                return suffix
+        return archive_path.suffix.lower()
+
+    def _split_member_name(self, member_name):
+        """Split an archive member name into (relative_dir, file_name).
+
+        Empty, '.' and '..' components are dropped, so the result never points outside the archive root.
+        """
+        parts = [part for part in member_name.split('/') if part not in ('', '.', '..')]
+        if not parts:
+            return "", ""
+        # Members of one directory share a single interned string, so prefix lookups hit by identity
+        return sys.intern(os.sep.join(parts[:-1])), parts[-1]
+
+    @contextmanager
+    def _open_zip_member(self, zf, info):
+        """Open a ZIP member from any thread.
+
+        ZipFile serializes reads of the shared file itself, but opening and closing a member
+        update an unguarded reference count, so only those two steps are locked here.
+        Decompression runs outside the lock, in parallel.
+        """
+        with self._zip_lock:
+            src = zf.open(info)
+        try:
+            yield src
+        finally:
+            with self._zip_lock:
+                src.close()
+
+    def _iter_zip(self, zf):
+        """Yield (relative_dir, file_name, size, open_member) for each file in an open ZIP archive.
+
+        Of several entries with the same name only the last is yielded, as it is the one extractall leaves.
+        """
+        latest = {}  # (relative_dir, file_name) -> last entry with that name
+        for info in zf.infolist():
+            if not info.is_dir():
+                latest[self._split_member_name(info.filename)] = info
+
+        for (rel_dir, name), info in latest.items():
+            if name:
+                yield rel_dir, name, info.file_size, partial(self._open_zip_member, zf, info)
+
+    def _iter_rar(self, archive_path):
+        """Yield (relative_dir, file_name, size, open_member) for each file in a RAR archive of stored members."""
+        with rarfile.RarFile(archive_path, 'r') as rf:
+            for info in rf.infolist():
+                if info.is_dir():
+                    continue
+                rel_dir, name = self._split_member_name(info.filename)
+                if name:
+                    # RarExtFile is a raw stream; buffer it so line iteration does not read byte by byte
+                    yield rel_dir, name, info.file_size, lambda info=info: io.BufferedReader(rf.open(info), COPY_BUFSIZE)
+
+    def _can_stream(self, archive_path):
+        """Check if the archive can be processed member by member, without a temporary directory."""
+        suffix_lower = self._get_archive_suffix(archive_path)
+        if suffix_lower in self.STREAMABLE_SUFFIXES:
+            return True
+
+        if suffix_lower == '.gz':
+            # A TAR inside a plain .gz is streamed like a .tar.gz, without a decompressed temporary copy
+            return self._is_gzipped_tar(archive_path)
+
+        if suffix_lower == '.rar' and HAS_RAR:
+            # rarfile reads stored members straight from the archive, but copies each compressed one
+            # to a temporary file and runs a separate unrar on it, which is far slower than one extractall
+            with rarfile.RarFile(archive_path, 'r') as rf:
+                return all(info.compress_type == rarfile.RAR_M0 and not info.needs_password()
+                           for info in rf.infolist() if not info.is_dir())
+
+        # 7z archives are usually solid as well, so they are extracted in one go
+        return False
+
+    def _iter_tar(self, archive_path):
+        """Yield (relative_dir, file_name, size, open_member) for each file in a TAR archive.
+
+        The archive is read in a single streaming pass. Each member must be consumed before
+        the next one is requested. Links are copied from the output already written for their
+        target; links whose target comes later in the stream are yielded after the pass.
+        """
+        targets = {}  # (relative_dir, file_name) of each file written so far -> size
+        forward_links = []
+        with self._open_tar_stream(archive_path) as tf:
+            for member in tf:
+                if member.isreg():
+                    rel_dir, name = self._split_member_name(member.name)
+                    if name:
+                        if not self._is_os_metadata(name, rel_dir):
+                            targets[(rel_dir, name)] = member.size
+                        yield rel_dir, name, member.size, partial(tf.extractfile, member)
+                elif member.islnk() or member.issym():
+                    link = self._resolve_link(member, targets)
+                    if link is None:
+                        forward_links.append(member)
+                    else:
+                        yield link
+
+        # Every file has been written by now; links to links may need several rounds
+        while forward_links:
+            remaining = []
+            for member in forward_links:
+                link = self._resolve_link(member, targets)
+                if link is None:
+                    remaining.append(member)
+                else:
+                    yield link
+            if len(remaining) == len(forward_links):
+                # Link targets outside the archive, directories or special files
+                break
+            forward_links = remaining
+
+    def _resolve_link(self, member, targets):
+        """Return (relative_dir, file_name, size, open_member) for a TAR link whose target was written, or None."""
+        rel_dir, name = self._split_member_name(member.name)
+        if not name:
+            return None
+        if member.issym():
+            # Symbolic links are relative to their own directory
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(member.name), member.linkname))
+            if target.startswith(('/', '../')):
+                return None
+        else:
+            target = member.linkname
+        target_key = self._split_member_name(target)
+        size = targets.get(target_key)
+        if size is None:
+            return None
+        # Links to this link reach the same file
+        targets[(rel_dir, name)] = size
+        return rel_dir, name, size, partial(self._open_output, *target_key)
+
     def extract_archive(self, archive_path, temp_dir):
         """Extract archive to temporary directory."""
         archive_path = Path(archive_path)
-        suffix_lower = archive_path.suffix.lower()
-
-        # Handle compound extensions
-        if len(archive_path.suffixes) >= 2:
-            compound = ''.join(archive_path.suffixes[-2:]).lower()
-            if compound in {'.tar.gz', '.tar.bz2', '.tar.xz'}:
-                suffix_lower = compound
+        suffix_lower = self._get_archive_suffix(archive_path)
 
         print(f"Extracting {archive_path.name}...")
 
         try:
-            if suffix_lower == '.zip':
-                self._extract_zip(archive_path, temp_dir)
-            elif suffix_lower in {'.tar', '.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.tbz2', '.txz'}:
-                self._extract_tar(archive_path, temp_dir)
-            elif suffix_lower == '.7z':
-                self._extract_7z(archive_path, temp_dir)
-            elif suffix_lower == '.rar':
-                self._extract_rar(archive_path, temp_dir)
-            elif suffix_lower == '.gz':
-                self._extract_gz(archive_path, temp_dir)
-            else:
+            extractor = self._extractors.get(suffix_lower)
+            if extractor is None:
                 raise ValueError(f"Unsupported archive format: {suffix_lower}")
+            extractor(archive_path, temp_dir)
 
         except Exception as e:
             print(f"Error extracting {archive_path}: {e}")
             raise
 
+    def _get_path_prefix(self, source_path_str):
+        """Return the "HASH_" filename prefix for a source directory, hashing each directory only once."""
+        prefix = self._prefix_cache.get(source_path_str)
+        if prefix is None:
+            # CRC-32 is a plain checksum: fast, in the standard library, and exactly 8 hex digits
+            path_hash = f"{zlib.crc32(source_path_str.encode()):08x}"
+            # Store mapping for later reference
+            self.hash_to_path[path_hash] = source_path_str
+            prefix = f"{path_hash}_"
+            self._prefix_cache[source_path_str] = prefix
+        return prefix
+
     def get_unique_filename(self, original_name, source_path_str="", part_num=None):
         """Generate a unique filename using prepended path hash for deduplication."""
-        base_name = Path(original_name).stem
-        extension = Path(original_name).suffix
+        # Same split as Path.stem / Path.suffix, without building a Path
+        dot = original_name.rfind('.')
+        if 0 < dot < len(original_name) - 1:
+            base_name, extension = original_name[:dot], original_name[dot:]
+        else:
+            base_name, extension = original_name, ''
 
         # Add .txt to specific extensions
         if extension.lower() in self.TXT_EXTENSIONS:
             extension += '.txt'
 
-        # Create filename with prepended path hash for deduplication
-        if source_path_str:
-            # Include hash of the source path for uniqueness (prepended)
-            path_hash = hashlib.md5(source_path_str.encode()).hexdigest()[:8]
-            if part_num is not None:
-                unique_filename = f"{path_hash}_{base_name}_part{part_num}{extension}"
-            else:
-                unique_filename = f"{path_hash}_{base_name}{extension}"
-            # Store mapping for later reference
-            self.hash_to_path[path_hash] = source_path_str
-        else:
-            # For files in root directory, use original name
-            if part_num is not None:
-                unique_filename = f"{base_name}_part{part_num}{extension}"
-            else:
-                unique_filename = f"{base_name}{extension}"
+        # Prepend a hash of the source path for deduplication; files in root directory keep their name
+        prefix = self._get_path_prefix(source_path_str) if source_path_str else ""
 
-        return unique_filename
+        if part_num is not None:
+            return f"{prefix}{base_name}_part{part_num}{extension}"
+        return f"{prefix}{base_name}{extension}"
 
     def write_mapping_file(self):
         """Write hash-to-path mapping to auxiliary file."""
@@ -191,145 +481,381 @@ class ArchiveExtractor:
 
         mapping_file = self.output_dir / ".path_mappings.txt"
 
+        # Sort once, and write the whole file in one go
+        mappings = [f"{path_hash} -> {source_path}" for path_hash, source_path in sorted(self.hash_to_path.items())]
         with open(mapping_file, 'w', encoding='utf-8') as f:
-            f.write("# Hash to Source Path Mapping\n")
-            f.write("# Generated by extract_flatten.py\n")
-            f.write("# Format: HASH -> SOURCE_PATH\n\n")
-
-            for path_hash, source_path in sorted(self.hash_to_path.items()):
-                f.write(f"{path_hash} -> {source_path}\n")
+            f.write("# Hash to Source Path Mapping\n"
+                    "# Generated by extract_flatten.py\n"
+                    "# Format: HASH -> SOURCE_PATH\n\n" +
+                    "\n".join(mappings) + "\n")
 
         print(f"\nPath mapping written to: {mapping_file}")
 
-        # Also print the mappings to console
-        print("\nHash to Path Mappings:")
-        for path_hash, source_path in sorted(self.hash_to_path.items()):
-            print(f"  {path_hash} -> {source_path}")
-
-    def _should_skip_file(self, file_path):
-        """Check if file should be skipped (e.g., empty files, OS metadata files)."""
-        # Skip empty files
-        if file_path.stat().st_size == 0:
+        # Also print the mappings to console; there can be thousands, so only when verbose
+        if self.verbose:
+            print("\nHash to Path Mappings:")
+            print("\n".join(f"  {mapping}" for mapping in mappings))
+
+    def _report(self, message):
+        """Queue a message from a copy worker; printing from many threads would interleave and contend."""
+        self._reports.append(message)
+
+    def _flush_reports(self):
+        """Print the queued worker messages in one write."""
+        lines = []
+        while self._reports:
+            lines.append(self._reports.popleft())
+        if lines:
+            print('\n'.join(lines))
+
+    def _is_os_metadata(self, file_name, rel_dir):
+        """Check if file is OS metadata, using its name and directory only."""
+        # Skip OS metadata files and AppleDouble files (resource forks)
+        if file_name in self.METADATA_FILES or file_name.startswith('._'):
             return True
 
-        # Get the file name and path components for checking
-        file_name = file_path.name
-        path_parts = file_path.parts
-
-        # Skip macOS metadata files
-        if '__MACOSX' in path_parts:
-            return True
-
-        # Skip AppleDouble files (resource forks)
-        if file_name.startswith('._'):
-            return True
-
-        # Skip common macOS system files
-        macos_files = {'.DS_Store', '.Trashes', '.fseventsd', '.Spotlight-V100', '.TemporaryItems'}
-        if file_name in macos_files:
-            return True
-
-        # Skip Windows system files
-        windows_files = {'Thumbs.db', 'desktop.ini', '$RECYCLE.BIN'}
-        if file_name in windows_files:
-            return True
-
-        # Skip Linux system files
-        if file_name == '.directory':  # KDE folder settings
-            return True
-
-        return False
-
-    def _split_large_file(self, file_path, source_dir, max_chunk_size=2.9 * 1000 * 1000):
-        """Split a large file into chunks using line boundaries."""
-        rel_path = file_path.relative_to(source_dir)
-        source_path_str = str(rel_path.parent) if rel_path.parent != Path('.') else ""
+        # Skip anything inside OS metadata directories such as __MACOSX
+        return bool(rel_dir) and not self.METADATA_DIRS.isdisjoint(rel_dir.split(os.sep))
 
+    def _should_skip_file(self, file_name, rel_dir, file_size):
+        """Check if file should be skipped (e.g., empty files, OS metadata files)."""
+        # Skip empty files
+        return file_size == 0 or self._is_os_metadata(file_name, rel_dir)
+
+    def _thread_buffer(self):
+        """Return this thread's reusable COPY_BUFSIZE buffer, as a memoryview."""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = memoryview(bytearray(COPY_BUFSIZE))
+        return buf
+
+    def _copy_stream(self, fsrc, fdst):
+        """Copy fsrc to fdst through a reusable buffer, instead of a new bytes object per block."""
+        buf = self._thread_buffer()
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            # Unbuffered files may write less than asked
+            view = buf[:n]
+            while view:
+                view = view[fdst.write(view):]
+
+    def _fast_copy(self, src, dst, size_hint):
+        """Copy file contents, in the kernel where possible.
+
+        size_hint is the size seen when the file was scanned; the copy is complete even if
+        the file has changed since. Metadata is not copied: the output is a derived artifact,
+        and copystat costs several extra syscalls per file.
+        """
+        # Unbuffered, so every read and write below is exactly one syscall
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            infd = fsrc.fileno()
+            outfd = fdst.fileno()
+            offset = 0
+
+            # Small files: one read into this thread's buffer and one write, no fstat and no kernel copy setup
+            if size_hint <= SMALL_FILE_SIZE:
+                buf = self._thread_buffer()
+                n = fsrc.readinto(buf)
+                offset = fdst.write(buf[:n])
+                if n < len(buf) and offset == n:
+                    # A short read means the whole file was read
+                    return
+                # The file grew past the buffer, or the write was short: copy the rest below
+                fsrc.seek(offset)
+
+            size = os.fstat(infd).st_size
+
+            # copy_file_range (Linux 4.5+, Python 3.8+) can share extents on CoW filesystems
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while offset < size:
+                        copied = os.copy_file_range(infd, outfd, size - offset)
+                        if copied == 0:
+                            break
+                        offset += copied
+                except OSError:
+                    pass
+
+            # sendfile to a regular file works on Linux 2.6.33+
+            if offset < size and hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+                try:
+                    while offset < size:
+                        sent = os.sendfile(outfd, infd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError:
+                    pass
+
+            # Copy whatever is left (or everything) through user space
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            self._copy_stream(fsrc, fdst)
+
+    def _read_at(self, fsrc, offset, count):
+        """Read exactly count bytes at offset from an unbuffered file."""
+        fsrc.seek(offset)
+        data = b''
+        while len(data) < count:
+            block = fsrc.read(count - len(data))
+            if not block:
+                raise OSError(f"{fsrc.name} was truncated while being split")
+            data += block
+        return data
+
+    def _find_cut(self, fsrc, start, end, size):
+        """Return the offset just past the last newline in [start, end), or past the first newline after end.
+
+        Only blocks near the chunk boundary are read, walking back from end and then, for a line
+        longer than a chunk, forward from it.
+        """
+        pos = end
+        while pos > start:
+            block_start = max(start, pos - COPY_BUFSIZE)
+            newline = self._read_at(fsrc, block_start, pos - block_start).rfind(b'\n')
+            if newline != -1:
+                return block_start + newline + 1
+            pos = block_start
+
+        # A single line longer than a chunk is kept whole
+        pos = end
+        while pos < size:
+            block = self._read_at(fsrc, pos, min(COPY_BUFSIZE, size - pos))
+            newline = block.find(b'\n')
+            if newline != -1:
+                return pos + newline + 1
+            pos += len(block)
+        return size
+
+    def _copy_range(self, fsrc, fdst, offset, count):
+        """Copy count bytes starting at offset from fsrc to the end of fdst."""
+        end = offset + count
+        # sendfile copies the range inside the kernel
+        if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+            try:
+                while offset < end:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, end - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass
+        while offset < end:
+            view = memoryview(self._read_at(fsrc, offset, min(COPY_BUFSIZE, end - offset)))
+            offset += len(view)
+            # Unbuffered files may write less than asked
+            while view:
+                view = view[fdst.write(view):]
+
+    def _split_file_on_disk(self, file_path, file_name, source_path_str, rel_path, max_chunk_size=MAX_CHUNK_SIZE):
+        """Split a large file into chunks on line boundaries, copying each chunk as a byte range.
+
+        Chunks follow the same rule as _split_large_file: as many whole lines as fit into
+        max_chunk_size, and a line longer than that on its own. Bytes are copied unchanged.
+        The file is read with plain reads rather than mapped, so a file truncated while it
+        is split (e.g. a live log) fails with OSError instead of SIGBUS.
+        """
+        max_chunk_size = int(max_chunk_size)
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                part_num = 1
-                current_chunk_size = 0
-                current_chunk_lines = []
-
-                for line in f:
-                    line_size = len(line.encode('utf-8'))
-
-                    # If adding this line would exceed the chunk size and we have lines in current chunk
-                    if current_chunk_size + line_size > max_chunk_size and current_chunk_lines:
-                        # Write current chunk
-                        unique_name = self.get_unique_filename(file_path.name, source_path_str, part_num)
-                        dest_path = self.output_dir / unique_name
-
-                        with open(dest_path, 'w', encoding='utf-8') as chunk_file:
-                            chunk_file.writelines(current_chunk_lines)
-
-                        print(f"Processed chunk {part_num}: {rel_path} -> {unique_name} ({current_chunk_size:,} bytes)")
-
-                        # Reset for next chunk
-                        part_num += 1
-                        current_chunk_lines = [line]
-                        current_chunk_size = line_size
+            with open(file_path, 'rb', buffering=0) as fsrc:
+                size = os.fstat(fsrc.fileno()).st_size
+                part_num = 0
+                start = 0
+                while start < size:
+                    end = start + max_chunk_size
+                    if end >= size:
+                        end = size
                     else:
-                        # Add line to current chunk
-                        current_chunk_lines.append(line)
-                        current_chunk_size += line_size
-
-                # Write the final chunk if there are remaining lines
-                if current_chunk_lines:
-                    unique_name = self.get_unique_filename(file_path.name, source_path_str, part_num)
-                    dest_path = self.output_dir / unique_name
+                        end = self._find_cut(fsrc, start, end, size)
 
-                    with open(dest_path, 'w', encoding='utf-8') as chunk_file:
-                        chunk_file.writelines(current_chunk_lines)
+                    part_num += 1
+                    unique_name = self.get_unique_filename(file_name, source_path_str, part_num)
+                    dest_path = os.path.join(self._output_dir_str, unique_name)
+                    with open(dest_path, 'wb', buffering=0) as chunk_file:
+                        self._copy_range(fsrc, chunk_file, start, end - start)
 
-                    print(f"Processed chunk {part_num}: {rel_path} -> {unique_name} ({current_chunk_size:,} bytes)")
+                    if self.verbose:
+                        self._report(f"Processed chunk {part_num}: {rel_path} -> {unique_name} ({end - start:,} bytes)")
+                    start = end
 
-                return part_num  # Return number of chunks created
+            return part_num  # Return number of chunks created
 
-        except (UnicodeDecodeError, Exception):
-            # File cannot be split by line boundaries, return None to indicate failure
+        except (OSError, ValueError):
+            # File cannot be read or copied in ranges, return None to indicate failure
             return None
 
-    def _process_single_file(self, file_path, source_dir, files_processed):
+    def _split_large_file(self, src, file_name, source_path_str, rel_path, max_chunk_size=MAX_CHUNK_SIZE):
+        """Split a large binary stream into chunks on line boundaries.
+
+        Chunks follow the same rule as _split_file_on_disk(), and bytes are written unchanged.
+        """
+        max_chunk_size = int(max_chunk_size)
+        part_num = 0
+        buf = bytearray()
+        eof = False
+
+        while True:
+            # Read until there is more than a chunk, so it is known whether this is the last one
+            while not eof and len(buf) <= max_chunk_size:
+                data = src.read(max_chunk_size + 1 - len(buf))
+                if data:
+                    buf += data
+                else:
+                    eof = True
+            if not buf:
+                break
+
+            if eof and len(buf) <= max_chunk_size:
+                cut = len(buf)
+            else:
+                cut = buf.rfind(b'\n', 0, max_chunk_size) + 1
+                if not cut:
+                    # A single line longer than a chunk is kept whole
+                    newline = buf.find(b'\n', max_chunk_size)
+                    while newline == -1 and not eof:
+                        searched = len(buf)
+                        data = src.read(COPY_BUFSIZE)
+                        if data:
+                            buf += data
+                            newline = buf.find(b'\n', searched)
+                        else:
+                            eof = True
+                    cut = len(buf) if newline == -1 else newline + 1
+
+            part_num += 1
+            unique_name = self.get_unique_filename(file_name, source_path_str, part_num)
+            dest_path = os.path.join(self._output_dir_str, unique_name)
+            with open(dest_path, 'wb') as chunk_file:
+                chunk_file.write(buf[:cut])
+
+            if self.verbose:
+                self._report(f"Processed chunk {part_num}: {rel_path} -> {unique_name} ({cut:,} bytes)")
+            del buf[:cut]
+
+        return part_num  # Return number of chunks created
+
+    def _process_single_file(self, file_path, rel_dir, file_name, file_size):
         """Process a single file - generate unique name and copy to output directory.
 
         Returns:
             bool: True if the file was split into chunks, False if copied as whole file
         """
         # Get relative path for context
-        rel_path = file_path.relative_to(source_dir)
-        source_path_str = str(rel_path.parent) if rel_path.parent != Path('.') else ""
+        rel_path = os.path.join(rel_dir, file_name) if rel_dir else file_name
 
-        # Check file size
-        file_size = file_path.stat().st_size
-        max_chunk_size = 2.9 * 1000 * 1000
-
-        if file_size > max_chunk_size:
+        if file_size > self.MAX_CHUNK_SIZE:
             # Split large files into chunks
-            print(f"File {rel_path} is {file_size:,} bytes, splitting into chunks...")
-            num_chunks = self._split_large_file(file_path, source_dir, max_chunk_size)
+            if self.verbose:
+                self._report(f"File {rel_path} is {file_size:,} bytes, splitting into chunks...")
+            num_chunks = self._split_file_on_disk(file_path, file_name, rel_dir, rel_path)
 
             if num_chunks is None:
                 # File cannot be split by line boundaries, copy entire file with warning
-                print(f"WARNING: Cannot split {rel_path} by line boundaries - copying entire file ({file_size:,} bytes)")
-                unique_name = self.get_unique_filename(file_path.name, source_path_str)
-                dest_path = self.output_dir / unique_name
-                shutil.copy2(file_path, dest_path)
-                print(f"Processed (unsplit): {rel_path} -> {unique_name}")
+                self._report(f"WARNING: Cannot split {rel_path} by line boundaries - copying entire file ({file_size:,} bytes)")
+                unique_name = self.get_unique_filename(file_name, rel_dir)
+                dest_path = os.path.join(self._output_dir_str, unique_name)
+                self._fast_copy(file_path, dest_path, file_size)
+                if self.verbose:
+                    self._report(f"Processed (unsplit): {rel_path} -> {unique_name}")
                 return False  # File was not split
             else:
-                print(f"Split {rel_path} into {num_chunks} chunks")
+                if self.verbose:
+                    self._report(f"Split {rel_path} into {num_chunks} chunks")
                 return True  # File was split
         else:
             # Generate unique filename
-            unique_name = self.get_unique_filename(file_path.name, source_path_str)
+            unique_name = self.get_unique_filename(file_name, rel_dir)
 
             # Copy file to output directory
-            dest_path = self.output_dir / unique_name
-            shutil.copy2(file_path, dest_path)
-            print(f"Processed: {rel_path} -> {unique_name}")
+            dest_path = os.path.join(self._output_dir_str, unique_name)
+            self._fast_copy(file_path, dest_path, file_size)
+            if self.verbose:
+                self._report(f"Processed: {rel_path} -> {unique_name}")
             return False  # File was not split
 
+    def _process_member(self, open_member, rel_dir, file_name, file_size):
+        """Process a single archive member - generate unique name and stream it to output directory.
+
+        Returns:
+            bool: True if the member was split into chunks, False if written as whole file
+        """
+        rel_path = os.path.join(rel_dir, file_name) if rel_dir else file_name
+
+        with open_member() as src:
+            if file_size > self.MAX_CHUNK_SIZE:
+                # Split large files into chunks
+                if self.verbose:
+                    self._report(f"File {rel_path} is {file_size:,} bytes, splitting into chunks...")
+                num_chunks = self._split_large_file(src, file_name, rel_dir, rel_path)
+                self._output_chunks[(rel_dir, file_name)] = num_chunks
+                if self.verbose:
+                    self._report(f"Split {rel_path} into {num_chunks} chunks")
+                return True
+
+            # Generate unique filename and stream the member straight to output directory
+            unique_name = self.get_unique_filename(file_name, rel_dir)
+            dest_path = os.path.join(self._output_dir_str, unique_name)
+            with open(dest_path, 'wb') as dst:
+                self._copy_stream(src, dst)
+        self._output_chunks[(rel_dir, file_name)] = 0
+        if self.verbose:
+            self._report(f"Processed: {rel_path} -> {unique_name}")
+        return False  # File was not split
+
+    def _open_output(self, rel_dir, file_name):
+        """Open the output written for an archive member, e.g. to copy it for a link to that member."""
+        output_key = (rel_dir, file_name)
+        self._wait_for_output(output_key)
+        chunks = self._output_chunks.get(output_key)
+        if chunks is None:
+            raise FileNotFoundError(f"No output for {file_name}")
+        if not chunks:
+            return open(os.path.join(self._output_dir_str, self.get_unique_filename(file_name, rel_dir)), 'rb')
+
+        # The member was split; exactly the chunks written for it are read back to back
+        return _ChainedFiles([os.path.join(self._output_dir_str, self.get_unique_filename(file_name, rel_dir, part_num))
+                              for part_num in range(1, chunks + 1)])
+
+    def _write_member(self, data, rel_dir, file_name):
+        """Write the contents of a small archive member, already read into memory, to output directory.
+
+        Returns:
+            bool: Always False, small members are never split
+        """
+        unique_name = self.get_unique_filename(file_name, rel_dir)
+        dest_path = os.path.join(self._output_dir_str, unique_name)
+        with open(dest_path, 'wb', buffering=0) as dst:
+            view = memoryview(data)
+            # Unbuffered files may write less than asked
+            while view:
+                view = view[dst.write(view):]
+        self._output_chunks[(rel_dir, file_name)] = 0
+        if self.verbose:
+            rel_path = os.path.join(rel_dir, file_name) if rel_dir else file_name
+            self._report(f"Processed: {rel_path} -> {unique_name}")
+        return False  # File was not split
+
+    def _scan(self, source_dir):
+        """Walk source_dir once with os.scandir, yielding (relative_dir, DirEntry) for every file.
+
+        Symlinked directories are not followed, matching Path.rglob().
+        """
+        stack = [(source_dir, "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            child_rel = sys.intern(os.path.join(rel_dir, entry.name) if rel_dir else entry.name)
+                            stack.append((entry.path, child_rel))
+                        elif entry.is_file():
+                            yield rel_dir, entry
+            except OSError as e:
+                print(f"Error scanning {dir_path}: {e}")
+
     def process_files(self, source_dir):
         """Process all files in the source directory recursively."""
         source_dir = Path(source_dir)
@@ -340,18 +866,40 @@ class ArchiveExtractor:
         print(f"Processing files from {source_dir}...")
         print(f"Recursively scanning all subdirectories...")
 
-        # Use rglob to recursively find all files in subdirectories
-        for file_path in source_dir.rglob('*'):
-            if file_path.is_file():
+        # Output names depend only on each file's own path, so the copies can run concurrently
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {}
+
+            # Single os.scandir pass over all subdirectories
+            for rel_dir, entry in self._scan(str(source_dir)):
                 try:
+                    # Name checks first, so OS metadata (e.g. the ._* files in __MACOSX) is never stat'ed.
+                    # DirEntry caches the stat result, so this is the only stat per file
+                    skip = self._is_os_metadata(entry.name, rel_dir)
+                    if not skip:
+                        file_size = entry.stat().st_size
+                        skip = file_size == 0
+
                     # Skip empty files
-                    if self._should_skip_file(file_path):
+                    if skip:
                         files_skipped += 1
-                        print(f"Skipping empty file: {file_path.relative_to(source_dir)}")
+                        if self.verbose:
+                            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                            print(f"Skipping empty file: {rel_path}")
                         continue
+                except Exception as e:
+                    print(f"Error processing {entry.path}: {e}")
+                    files_skipped += 1
+                    continue
 
-                    # Process the file
-                    was_split = self._process_single_file(file_path, source_dir, files_processed + 1)
+                # Process the file
+                future = executor.submit(self._process_single_file, entry.path, rel_dir, entry.name, file_size)
+                futures[future] = entry.path
+
+            for future in as_completed(futures):
+                self._flush_reports()
+                try:
+                    was_split = future.result()
                     files_processed += 1
                     if was_split:
                         files_split += 1
@@ -360,9 +908,147 @@ class ArchiveExtractor:
                         print(f"Processed {files_processed} files...")
 
                 except Exception as e:
-                    print(f"Error processing {file_path}: {e}")
+                    print(f"Error processing {futures[future]}: {e}")
+                    files_skipped += 1
+
+        self._flush_reports()
+        print(f"Processing complete: {files_processed} files processed, {files_skipped} files skipped, {files_split} files split")
+
+        # Write mapping file
+        self.write_mapping_file()
+
+        return files_processed, files_skipped, files_split
+
+    def _wait_for_output(self, output_key):
+        """Wait until a write already submitted for the same output has finished, so writes stay in order."""
+        previous = self._pending_outputs.get(output_key)
+        if previous is not None:
+            wait([previous])
+
+    def _replace_output(self, outputs, output_key):
+        """Remove the output of an earlier member with the same name, so a later member replaces it entirely.
+
+        An earlier member may have been split while the later one is not, or into more chunks,
+        so its files are deleted rather than overwritten.
+        """
+        self._wait_for_output(output_key)
+        self._pending_outputs.pop(output_key, None)
+        outputs.pop(output_key, None)
+        chunks = self._output_chunks.pop(output_key, None)
+        if chunks is None:
+            return
+
+        rel_dir, file_name = output_key
+        if chunks:
+            unique_names = [self.get_unique_filename(file_name, rel_dir, part_num) for part_num in range(1, chunks + 1)]
+        else:
+            unique_names = [self.get_unique_filename(file_name, rel_dir)]
+        for unique_name in unique_names:
+            try:
+                os.remove(os.path.join(self._output_dir_str, unique_name))
+            except FileNotFoundError:
+                pass
+
+    def _record_output(self, outputs, output_key, was_split):
+        """Count a written archive member; a later member with the same name replaces the output, not adds one."""
+        is_new = output_key not in outputs
+        outputs[output_key] = was_split
+        if is_new and len(outputs) % 100 == 0:
+            print(f"Processed {len(outputs)} files...")
+
+    def process_archive(self, archive_path):
+        """Process all files in a ZIP, TAR or RAR archive, writing each member straight to the output directory."""
+        archive_path = Path(archive_path)
+        outputs = {}  # (relative_dir, file_name) -> whether its output was split; counted once per name
+        files_skipped = 0
+
+        with ExitStack() as stack:
+            executor = None
+            suffix_lower = self._get_archive_suffix(archive_path)
+            if suffix_lower == '.zip':
+                # ZIP members are compressed independently and can be read in any order,
+                # so they are decompressed and written by a thread pool
+                zf = stack.enter_context(zipfile.ZipFile(archive_path, 'r'))
+                members = self._iter_zip(zf)
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=self.workers))
+            elif suffix_lower == '.rar':
+                members = self._iter_rar(archive_path)
+            else:
+                members = self._iter_tar(archive_path)
+                # TAR members must be read in order, but small ones are read into memory
+                # and written by a thread pool while the main thread reads ahead
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=self.workers))
+                # Bounds the member data held in memory to 2 * workers * COPY_BUFSIZE
+                in_flight = threading.BoundedSemaphore(2 * self.workers)
+
+            print(f"Extracting {archive_path.name}...")
+
+            futures = {}
+            try:
+                for rel_dir, file_name, file_size, open_member in members:
+                    rel_path = os.path.join(rel_dir, file_name) if rel_dir else file_name
+                    try:
+                        # Members with the same name share an output; like extractall, the last one wins
+                        output_key = (rel_dir, file_name)
+                        self._replace_output(outputs, output_key)
+
+                        # Skip empty files
+                        if self._should_skip_file(file_name, rel_dir, file_size):
+                            files_skipped += 1
+                            if self.verbose:
+                                print(f"Skipping empty file: {rel_path}")
+                            continue
+
+                        if suffix_lower == '.zip':
+                            future = executor.submit(self._process_member, open_member, rel_dir, file_name, file_size)
+                            self._pending_outputs[output_key] = future
+                            futures[future] = (rel_path, output_key)
+                            continue
+
+                        if executor is not None and file_size <= COPY_BUFSIZE:
+                            with open_member() as src:
+                                data = src.read()
+                            in_flight.acquire()
+                            future = executor.submit(self._write_member, data, rel_dir, file_name)
+                            future.add_done_callback(lambda _: in_flight.release())
+                            self._pending_outputs[output_key] = future
+                            futures[future] = (rel_path, output_key)
+                            continue
+
+                        # Stream members must be consumed in order, before the next one is read
+                        was_split = self._process_member(open_member, rel_dir, file_name, file_size)
+                        self._flush_reports()
+                        self._record_output(outputs, output_key, was_split)
+
+                    except Exception as e:
+                        self._flush_reports()
+                        print(f"Error processing {rel_path}: {e}")
+                        files_skipped += 1
+
+            except Exception as e:
+                print(f"Error extracting {archive_path}: {e}")
+                # Let pending writes finish, then map what was written so the partial output can be traced
+                stack.close()
+                self._flush_reports()
+                self.write_mapping_file()
+                print(f"Output in {self.output_dir} is partial: it holds only the members read before the error")
+                raise
+
+            for future in as_completed(futures):
+                self._flush_reports()
+                rel_path, output_key = futures[future]
+                try:
+                    was_split = future.result()
+                    # Futures finish in any order; only the last one submitted for a name holds its output
+                    if self._pending_outputs.get(output_key) is future:
+                        self._record_output(outputs, output_key, was_split)
+                except Exception as e:
+                    print(f"Error processing {rel_path}: {e}")
                     files_skipped += 1
 
+        self._flush_reports()
+        files_processed = len(outputs)
+        files_split = sum(outputs.values())
         print(f"Processing complete: {files_processed} files processed, {files_skipped} files skipped, {files_split} files split")
 
         # Write mapping file
@@ -382,6 +1068,9 @@ class ArchiveExtractor:
         elif self.is_archive(self.source_path):
             print(f"Processing archive: {self.source_path}")
 
+            if self._can_stream(self.source_path):
+                return self.process_archive(self.source_path)
+
             # Create temporary directory for extraction
             with tempfile.TemporaryDirectory() as temp_dir:
                 self.extract_archive(self.source_path, temp_dir)
@@ -390,6 +1079,17 @@ class ArchiveExtractor:
             raise ValueError(f"Source is neither a directory nor a supported archive: {self.source_path}")
 
 
+def _positive_int(value):
+    """argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _create_argument_parser():
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -422,7 +1122,8 @@ Notes:
 
     parser.add_argument('-s', '--source', required=True, metavar='SRC', help='Source directory or archive file')
     parser.add_argument('-o', '--output', required=True, metavar='OUT', help='Output directory for flattened files')
-    parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-j', '--jobs', type=_positive_int, metavar='N', help='Number of parallel copy threads (default: 4 per CPU, max 32)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output (print every processed and skipped file)')
 
     return parser
 
@@ -433,7 +1134,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        extractor = ArchiveExtractor(args.source, args.output)
+        extractor = ArchiveExtractor(args.source, args.output, verbose=args.verbose, workers=args.jobs)
         processed, skipped, split = extractor.run()
 
         print(f"\nSummary:")
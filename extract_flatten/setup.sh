@@ -35,6 +35,7 @@ echo
 echo "Optional dependencies for extended format support:"
 echo "  - py7zr: Enables 7ZIP (.7z) support"
 echo "  - rarfile: Enables RAR (.rar) support"
+echo "  - isal: Faster GZIP (.gz, .tar.gz) decompression"
 echo
 
 read -p "Install optional dependencies? (y/n): " -n 1 -r
@@ -47,7 +48,7 @@ if [[ $REPLY =~ ^[Yy]$ ]]; then
         echo "✓ Optional dependencies installed"
     else
         echo "❌ pip3 not found. Please install manually:"
-        echo "   pip install py7zr rarfile"
+        echo "   pip install py7zr rarfile isal"
     fi
 else
     echo "⚠️  Skipping optional dependencies"